@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
 import sys
 import os
-from datetime import datetime, timezone
 import base64
+import csv
+import hashlib
+import shutil
+import time
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from dateutil.tz import tzlocal
+import matplotlib
+
+matplotlib.use("Agg")  # sin interfaz gráfica: no probar Tk/Qt
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import PIL
+from PIL import Image
 
 REGISTER = 3541908
 
@@ -49,48 +62,181 @@ PARTY_NAMES = {
 
 OUTPUT_HTML = "public/index.html"
 
+# Páginas ya generadas, por hash de la entrada (fuera de public/)
+CACHE_DIR = ".cache"
 
-def format_ts(ts):
-    dt = datetime.fromtimestamp(ts, tz=timezone.utc).astimezone()
-    return dt.strftime("%d/%m/%Y %I:%M%p").lstrip("0")
+# Compresión zlib rápida: el PNG va embebido en base64, el tamaño extra es poco
+PNG_OPTIONS = {"compress_level": 1, "optimize": False}
 
+# Bytes de PNG que se codifican en base64 por cada escritura (múltiplo de 3)
+BASE64_CHUNK = 3 * 16384
 
-def plot_votes_over_time(df):
-    fig, ax = plt.subplots(figsize=(10, 10))
+# Las imágenes se muestran a 48rem como máximo, 90 DPI alcanza de sobra
+FIGURE_DPI = 90
 
-    x_labels = df["timestamp"].apply(format_ts)
-    x = range(len(df))
+# Las tres gráficas se dibujan en una sola figura, una debajo de la otra
+PANEL_HEIGHTS = [8, 10, 8]  # votos por corte, evolución, tendencia
+FIGURE_SIZE = (12, sum(PANEL_HEIGHTS))
+PANEL_PAD = 1.08  # margen de tight_layout, en tamaños de letra
 
-    max_pct = 0
+# Umbral de simplificación más agresivo (por defecto 0.111): une segmentos que
+# se desvían menos de un pixel. Con pocos cortes casi no cambia nada; importa
+# si las líneas llegan a tener muchos puntos.
+matplotlib.rcParams.update({"path.simplify_threshold": 1.0})
 
-    for col in PARTIES:
-        color = COLORS.get(col, "#333333")
-        percentages = (df[col] / df["valid"]) * 100
-        max_pct = max(max_pct, percentages.max())
+# Indexados por trend_index: bajando, estable, subiendo
+TREND_ARROWS = ("▼", "─", "▲")
+TREND_CLASSES = ("trend-down", "trend-neutral", "trend-up")
 
-        ax.plot(
-            x,
-            percentages,
-            marker="o",
-            label=col.upper(),
-            color=color,
-            linewidth=2,
-        )
+TABLE_ROW = """
+        <tr>
+            <td>{name}</td>
+            <td>{votes:,}</td>
+            <td>{pct:.2f}%</td>
+            <td class="{trend_class}">{trend_indicator}</td>
+        </tr>
+        """
+
+
+def input_hash(input_csv):
+    """Hash de todo lo que determina la página
+
+    El CSV, este script, la zona horaria local y las versiones de las
+    bibliotecas que calculan y dibujan.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for path in (input_csv, __file__):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    h.update(repr((time.tzname, time.timezone)).encode("utf-8"))
+    versions = (matplotlib.__version__, pd.__version__, np.__version__, PIL.__version__)
+    h.update(repr(versions).encode("utf-8"))
+    return h.hexdigest()
+
+
+def read_cuts(input_csv):
+    """Lee el CSV de cortes; el esquema es fijo, así que no se infieren tipos"""
+    # utf-8-sig acepta el BOM que agrega Excel; los campos pueden ir entre comillas
+    with open(input_csv, encoding="utf-8-sig") as f:
+        header = next(csv.reader(f))
+
+        if header != COLUMNS:
+            raise ValueError(f"Unexpected columns: {header}")
+
+        values = np.loadtxt(f, delimiter=",", quotechar='"', dtype=np.int64, ndmin=2)
+
+    # Los votos caben de sobra en int32 (el padrón no llega a 4M)
+    return pd.DataFrame(values, columns=COLUMNS).astype(
+        {col: np.int32 for col in COLUMNS[1:]}
+    )
+
+
+def format_timestamps(timestamps):
+    dt = pd.to_datetime(timestamps, unit="s", utc=True).dt.tz_convert(tzlocal())
+    return dt.dt.strftime("%d/%m/%Y %I:%M%p").str.lstrip("0")
+
+
+def compute_percentages(df):
+    """Porcentajes de cada partido sobre el padrón y sobre los votos válidos
+
+    Se usa float32: la precisión perdida no se nota a tres decimales y se
+    mueve la mitad de bytes que con float64.
+    """
+    votes = df[PARTIES].to_numpy(dtype=np.float32)
+
+    pct_register = votes / REGISTER * 100.0
+    pct_valid = votes / df["valid"].to_numpy(dtype=np.float32)[:, None] * 100.0
 
-        last_x = x[-1]
-        last_pct = percentages.iloc[-1]
-        last_votes = df[col].iloc[-1]
+    return pct_register, pct_valid
+
+
+def find_panel_split(pixels, start, stop):
+    """Fila a la mitad del tramo en blanco más largo entre dos gráficas"""
+    rows = pixels[start:stop]
+    blank = np.flatnonzero((rows == pixels[0, 0]).all(axis=(1, 2)))
+
+    if len(blank) == 0:
+        return (start + stop) // 2
+
+    runs = np.split(blank, np.flatnonzero(np.diff(blank) > 1) + 1)
+    run = max(runs, key=len)
+    return start + int(run[len(run) // 2])
+
+
+def encode_png(pixels):
+    """Codifica un arreglo RGBA como bytes PNG"""
+    buffer = BytesIO()
+    Image.fromarray(pixels).save(buffer, format="png", **PNG_OPTIONS)
+    return buffer.getvalue()
 
+
+def render_panels(fig, axes):
+    """Rasteriza la figura una sola vez y recorta un PNG por cada eje"""
+    # El doble del margen por defecto, para que cada recorte quede con el
+    # mismo margen que tendría como figura independiente
+    fig.tight_layout(h_pad=2 * PANEL_PAD)
+
+    fig.canvas.draw()
+    pixels = np.asarray(fig.canvas.buffer_rgba())
+    height = pixels.shape[0]
+
+    # Coordenadas de pantalla: el origen está abajo a la izquierda
+    splits = [0]
+    for upper, lower in zip(axes, axes[1:]):
+        start = int(height - upper.bbox.y0)
+        stop = int(height - lower.bbox.y1)
+        splits.append(find_panel_split(pixels, start, stop))
+    splits.append(height)
+
+    # Pillow suelta el GIL al comprimir: los tres PNG se codifican a la vez
+    panels = [pixels[top:bottom] for top, bottom in zip(splits, splits[1:])]
+    with ThreadPoolExecutor(max_workers=len(panels)) as executor:
+        return list(executor.map(encode_png, panels))
+
+
+def setup_time_axis(ax, x_labels, grid_axis="y"):
+    """Aplica el formato común del eje de cortes (hora) a una gráfica"""
+    ax.set_xticks(range(len(x_labels)))
+    ax.set_xticklabels(x_labels, rotation=45)
+    ax.grid(True, axis=grid_axis, linestyle="--", alpha=0.6)
+    ax.legend()
+
+
+def annotate_last_values(ax, last_x, last_values, labels):
+    """Escribe la etiqueta de cada partido junto a su último punto"""
+    for col, last_value, label in zip(PARTIES, last_values, labels):
+        # Los puntos están dentro de los ejes: no hace falta revisar el recorte
         ax.annotate(
-            f"{last_votes:,} votos",
-            xy=(last_x, last_pct),
+            label,
+            xy=(last_x, last_value),
             xytext=(8, 0),
             textcoords="offset points",
             fontsize=9,
-            color=color,
+            color=COLORS.get(col, "#333333"),
             va="center",
+            annotation_clip=False,
         )
 
+
+def plot_votes_over_time(ax, df, x_labels, pct_valid):
+    x = range(len(df))
+
+    max_pct = pct_valid.max()
+
+    ax.set_prop_cycle(color=[COLORS.get(col, "#333333") for col in PARTIES])
+    ax.plot(
+        x,
+        pct_valid,
+        marker="o",
+        label=[col.upper() for col in PARTIES],
+        linewidth=2,
+    )
+
+    last_votes = df[PARTIES].iloc[-1]
+    annotate_last_values(
+        ax, x[-1], pct_valid[-1], [f"{votes:,} votos" for votes in last_votes]
+    )
+
     if max_pct >= 38:
         ax.axhline(
             40,
@@ -104,49 +250,26 @@ def plot_votes_over_time(df):
     ax.set_xlabel("Hora")
     ax.set_ylabel("Porcentaje del padrón (%)")
 
-    ax.set_xticks(list(x))
-    ax.set_xticklabels(x_labels, rotation=45)
-    ax.grid(True, axis="y", linestyle="--", alpha=0.6)
-    ax.legend()
-
-    buffer = BytesIO()
-    plt.tight_layout()
-    fig.savefig(buffer, format="png")
-    plt.close(fig)
-
-    buffer.seek(0)
-    return base64.b64encode(buffer.read()).decode("utf-8")
+    setup_time_axis(ax, x_labels)
 
 
-def plot_popularity_trends(df):
+def plot_popularity_trends(ax, df, x_labels, pct_register):
     """Grafica la tendencia de popularidad (aceleración/desaceleración) de cada partido"""
-    fig, ax = plt.subplots(figsize=(10, 8))
-
-    x_labels = df["timestamp"].apply(format_ts)
     x = range(len(df))
 
-    for party in PARTIES:
-        color = COLORS.get(party, "#333333")
-
-        # Calcular porcentajes del padrón
-        percentages = (df[party] / REGISTER) * 100
-
-        # Calcular el crecimiento entre cortes
-        growth = percentages.diff()
+    # Cambio en el crecimiento entre cortes (segunda diferencia)
+    trend = np.diff(pct_register, n=2, axis=0)
 
-        # Calcular cambio en el crecimiento
-        trend = growth.diff()
-
-        # Solo graficar desde el índice 2
-        if len(trend) > 2:
-            ax.plot(
-                x[2:],
-                trend.iloc[2:],
-                marker="o",
-                label=PARTY_NAMES[party],
-                color=color,
-                linewidth=2,
-            )
+    # Solo graficar desde el índice 2
+    if len(trend) > 0:
+        ax.set_prop_cycle(color=[COLORS.get(p, "#333333") for p in PARTIES])
+        ax.plot(
+            x[2:],
+            trend,
+            marker="o",
+            label=[PARTY_NAMES[p] for p in PARTIES],
+            linewidth=2,
+        )
 
     # Línea de referencia en 0 (constante)
     ax.axhline(
@@ -162,11 +285,7 @@ def plot_popularity_trends(df):
     ax.set_xlabel("Hora")
     ax.set_ylabel("Cambio en crecimiento (puntos porcentuales)")
 
-    ax.set_xticks(list(x))
-    ax.set_xticklabels(x_labels, rotation=45)
-
-    ax.grid(True, linestyle="--", alpha=0.6)
-    ax.legend()
+    setup_time_axis(ax, x_labels, grid_axis="both")
 
     # Añadir texto explicativo
     ax.text(
@@ -180,77 +299,65 @@ def plot_popularity_trends(df):
         bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.3),
     )
 
-    buffer = BytesIO()
-    plt.tight_layout()
-    fig.savefig(buffer, format="png")
-    plt.close(fig)
-
-    buffer.seek(0)
-    return base64.b64encode(buffer.read()).decode("utf-8")
-
 
-def compute_stats(df):
-    stats = df.copy()
+def compute_stats(df, pct_valid):
+    total_votes = (df["valid"] + df["null"]).rename("total_votes")
 
-    stats["total_votes"] = stats["valid"] + stats["null"]
+    # Crecimiento (primera derivada); el primer corte queda en 0
+    growth = np.diff(pct_valid, axis=0, prepend=pct_valid[:1])
 
-    # Calcular porcentaje sobre votos válidos
-    for col in PARTIES:
-        stats[f"pct_{col}"] = (stats[col] / stats["valid"]) * 100
+    # Tendencia (segunda derivada)
+    trend = np.diff(growth, axis=0, prepend=growth[:1])
+
+    derived = pd.DataFrame(
+        np.hstack([pct_valid, growth, trend]),
+        index=df.index,
+        columns=[
+            f"{prefix}_{col}"
+            for prefix in ("pct", "growth", "trend")
+            for col in PARTIES
+        ],
+    )
 
-    # Crecimiento (primera derivada)
-    for col in PARTIES:
-        stats[f"growth_{col}"] = stats[f"pct_{col}"].diff().fillna(0)
+    # Copy-on-Write: las columnas de df se comparten, no se copian
+    return pd.concat([df, total_votes, derived], axis=1)
 
-    # Tendencia (segunda derivada)
-    for col in PARTIES:
-        stats[f"trend_{col}"] = stats[f"growth_{col}"].diff().fillna(0)
 
-    return stats
+def trend_index(trend_value):
+    """0 = bajando, 1 = estable, 2 = subiendo (umbral de ±0.01 puntos)"""
+    return int(trend_value > 0.01) - int(trend_value < -0.01) + 1
 
 
 def get_trend_indicator(trend_value):
     """Retorna un indicador visual de la tendencia con porcentaje"""
-    if trend_value > 0.01:
-        return f"▲ {trend_value:+.3f}%"
-    elif trend_value < -0.01:
-        return f"▼ {trend_value:+.3f}%"
-    else:
-        return f"─ {trend_value:+.3f}%"
+    return f"{TREND_ARROWS[trend_index(trend_value)]} {trend_value:+.3f}%"
 
 
 def get_trend_class(trend_value):
     """Retorna una clase CSS basada en la tendencia"""
-    if trend_value > 0.01:
-        return "trend-up"
-    elif trend_value < -0.01:
-        return "trend-down"
-    else:
-        return "trend-neutral"
+    return TREND_CLASSES[trend_index(trend_value)]
 
 
 def generate_results_table(stats):
-    last = stats.iloc[-1]
-
-    # Crear lista de partidos con sus votos y porcentaje
-    party_info = [(p, last[p], last[f"pct_{p}"]) for p in PARTIES]
-    # Ordenar por votos de mayor a menor
-    party_info.sort(key=lambda x: x[1], reverse=True)
-
-    rows = []
-    for p, votes, pct in party_info:
-        trend = last[f"trend_{p}"]
-        trend_indicator = get_trend_indicator(trend)
-        trend_class = get_trend_class(trend)
-
-        rows.append(f"""
-        <tr>
-            <td>{PARTY_NAMES[p]}</td>
-            <td>{int(votes):,}</td>
-            <td>{pct:.2f}%</td>
-            <td class="{trend_class}">{trend_indicator}</td>
-        </tr>
-        """)
+    # Votos, porcentaje y tendencia del último corte, una fila por partido
+    columns = PARTIES + [f"pct_{p}" for p in PARTIES] + [f"trend_{p}" for p in PARTIES]
+    last = stats.iloc[[-1]][columns].to_numpy()[0].reshape(3, len(PARTIES))
+
+    # Ordenar por votos de mayor a menor; estable para respetar empates
+    order = np.argsort(-last[0], kind="stable")
+    votes, pcts, trends = last[:, order].tolist()
+    names = np.array(PARTIES)[order].tolist()
+
+    rows = [
+        TABLE_ROW.format(
+            name=PARTY_NAMES[p],
+            votes=int(party_votes),
+            pct=pct,
+            trend_class=get_trend_class(trend),
+            trend_indicator=get_trend_indicator(trend),
+        )
+        for p, party_votes, pct, trend in zip(names, votes, pcts, trends)
+    ]
 
     return f"""
     <table>
@@ -269,143 +376,153 @@ def generate_results_table(stats):
     """
 
 
-def plot_votes_per_cut(df):
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    x_labels = df["timestamp"].apply(format_ts)
+def plot_votes_per_cut(ax, df, x_labels):
     x = range(len(df))
 
-    for party in PARTIES:
-        ax.plot(
-            x,
-            df[party],
-            marker="o",
-            label=PARTY_NAMES[party],
-            color=COLORS.get(party, "#333333"),
-            linewidth=2,
-        )
+    votes = df[PARTIES].to_numpy()
 
-        # Mostrar último valor sobre el punto final
-        ax.annotate(
-            f"{df[party].iloc[-1]:,}",
-            xy=(x[-1], df[party].iloc[-1]),
-            xytext=(8, 0),
-            textcoords="offset points",
-            fontsize=9,
-            color=COLORS.get(party, "#333333"),
-            va="center",
-        )
+    ax.set_prop_cycle(color=[COLORS.get(p, "#333333") for p in PARTIES])
+    ax.plot(
+        x,
+        votes,
+        marker="o",
+        label=[PARTY_NAMES[p] for p in PARTIES],
+        linewidth=2,
+    )
+
+    # Mostrar último valor sobre el punto final
+    annotate_last_values(ax, x[-1], votes[-1], [f"{v:,}" for v in votes[-1]])
 
     ax.set_title("Votos por Partido en cada Corte")
     ax.set_xlabel("Hora")
     ax.set_ylabel("Cantidad de Votos")
-    ax.set_xticks(list(x))
-    ax.set_xticklabels(x_labels, rotation=45)
-    ax.grid(True, axis="y", linestyle="--", alpha=0.6)
-    ax.legend()
+    setup_time_axis(ax, x_labels)
 
-    buffer = BytesIO()
-    plt.tight_layout()
-    fig.savefig(buffer, format="png")
-    plt.close(fig)
-
-    buffer.seek(0)
-    return base64.b64encode(buffer.read()).decode("utf-8")
 
-
-def generate_html(img_base64, popularity_img_base64, table_html, df):
-    last = df.iloc[-1]
-    votos_emitidos = last["valid"] + last["null"]
-    votos_nulos = last["null"]
-    votes_per_cut_img = plot_votes_per_cut(df)
-
-    return f"""<!DOCTYPE html>
+# Partes fijas de la página; solo se intercalan los datos de cada corte
+HTML_PREFIX = """<!DOCTYPE html>
 <html lang="es">
 <head>
     <meta charset="utf-8">
     <title>Elecciones Costa Rica 2022 | Primera Ronda</title>
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             padding: 1rem;
             max-width: 60rem;
             margin: auto;
-        }}
-        h1, h2 {{
+        }
+        h1, h2 {
             text-align: center;
             margin: 4rem 0;
-        }}
-        .chart {{
+        }
+        .chart {
             margin: 2rem 0;
             text-align: center;
-        }}
-        img.chart-img {{
+        }
+        img.chart-img {
             width: 100%;
             max-width: 48rem;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 2rem;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 0.6rem;
             border-bottom: 1px solid #ddd;
             text-align: center;
-        }}
-        th {{
+        }
+        th {
             background: #f3f3f3;
-        }}
-        .flag {{
+        }
+        .flag {
             width: 24px;
             vertical-align: middle;
             margin-right: 0.4rem;
-        }}
-        .summary {{
+        }
+        .summary {
             margin: 1.5rem 0;
             text-align: center;
             font-size: 1.1rem;
-        }}
-        .trend-up {{
+        }
+        .trend-up {
             color: #22c55e;
             font-weight: bold;
-        }}
-        .trend-down {{
+        }
+        .trend-down {
             color: #ef4444;
             font-weight: bold;
-        }}
-        .trend-neutral {{
+        }
+        .trend-neutral {
             color: #6b7280;
             font-weight: bold;
-        }}
+        }
     </style>
 </head>
 <body>
     <h1>Elecciones Costa Rica 2022 | Primera Ronda</h1>
-    <div class="summary">
+"""
+
+HTML_SUMMARY = """    <div class="summary">
         Votos emitidos: {votos_emitidos:,} | Nulos y blancos: {votos_nulos:,}
     </div>
-    {table_html}
+    """
+
+HTML_VOTES_PER_CUT = """
     <hr>
     <h2>Votos por Corte</h2>
     <div class="chart">
-        <img class="chart-img" src="data:image/png;base64,{votes_per_cut_img}" alt="Votos por Corte">
+        <img class="chart-img" src="data:image/png;base64,"""
+
+HTML_VOTES_OVER_TIME = """" alt="Votos por Corte">
     </div>
     <hr>
     <h2>Evolución de Votos</h2>
     <div class="chart">
-        <img class="chart-img" src="data:image/png;base64,{img_base64}" alt="Votos en el tiempo">
+        <img class="chart-img" src="data:image/png;base64,"""
+
+HTML_TRENDS = """" alt="Votos en el tiempo">
     </div>
     <hr>
     <h2>Tendencia</h2>
     <div class="chart">
-        <img class="chart-img" src="data:image/png;base64,{popularity_img_base64}" alt="Tendencia">
+        <img class="chart-img" src="data:image/png;base64,"""
+
+HTML_SUFFIX = """" alt="Tendencia">
     </div>
 </body>
 </html>
 """
 
 
+def write_html(f, votes_img, popularity_img, votes_per_cut_img, table_html, df):
+    """Escribe la página en el archivo binario f
+
+    Los PNG se codifican en base64 por tramos, así en memoria nunca está
+    la imagen codificada completa ni la página como un solo string.
+    """
+    last = df.iloc[-1]
+    summary = HTML_SUMMARY.format(
+        votos_emitidos=last["valid"] + last["null"],
+        votos_nulos=last["null"],
+    )
+
+    f.write((HTML_PREFIX + summary + table_html + HTML_VOTES_PER_CUT).encode("utf-8"))
+
+    for png, html in (
+        (votes_per_cut_img, HTML_VOTES_OVER_TIME),
+        (votes_img, HTML_TRENDS),
+        (popularity_img, HTML_SUFFIX),
+    ):
+        # Tramos múltiplos de 3 bytes: el base64 sale igual, sin relleno intermedio
+        view = memoryview(png)
+        for start in range(0, len(view), BASE64_CHUNK):
+            f.write(base64.b64encode(view[start : start + BASE64_CHUNK]))
+        f.write(html.encode("utf-8"))
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print(f"Usage: {sys.argv[0]} <input.csv>")
@@ -413,20 +530,39 @@ if __name__ == "__main__":
 
     input_csv = sys.argv[1]
 
-    df = pd.read_csv(input_csv, dtype=int)
+    os.makedirs("public", exist_ok=True)
 
-    if list(df.columns) != COLUMNS:
-        raise ValueError(f"Unexpected columns: {list(df.columns)}")
+    cached_html = os.path.join(CACHE_DIR, f"{input_hash(input_csv)}.html")
+    if os.path.exists(cached_html):
+        shutil.copyfile(cached_html, OUTPUT_HTML)
+        sys.exit(0)
 
-    os.makedirs("public", exist_ok=True)
+    df = read_cuts(input_csv)
+
+    # Se calculan una sola vez y se comparten entre gráficas y estadísticas
+    pct_register, pct_valid = compute_percentages(df)
+
+    stats = compute_stats(df, pct_valid)
+
+    x_labels = format_timestamps(df["timestamp"])
 
-    stats = compute_stats(df)
+    # Una sola figura y un solo canvas Agg para las tres gráficas
+    fig = Figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI)
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(len(PANEL_HEIGHTS), 1, height_ratios=PANEL_HEIGHTS)
 
-    img_base64 = plot_votes_over_time(df)
-    popularity_img_base64 = plot_popularity_trends(df)
+    plot_votes_per_cut(axes[0], df, x_labels)
+    plot_votes_over_time(axes[1], df, x_labels, pct_valid)
+    plot_popularity_trends(axes[2], df, x_labels, pct_register)
+    votes_per_cut_img, votes_img, popularity_img = render_panels(fig, axes)
     table_html = generate_results_table(stats)
 
-    html = generate_html(img_base64, popularity_img_base64, table_html, df)
+    with open(OUTPUT_HTML, "wb") as f:
+        write_html(f, votes_img, popularity_img, votes_per_cut_img, table_html, df)
 
-    with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Solo se guarda la última página: las anteriores ya no se vuelven a usar
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".html"):
+            os.remove(os.path.join(CACHE_DIR, name))
+    shutil.copyfile(OUTPUT_HTML, cached_html)